@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Asset Manifest
+Lists the BitPlanner asset tree once into an in-memory set so icon lookups
+don't have to stat the filesystem per item. The manifest is cached on disk
+together with the mtime of every directory it walked; when none of them
+changed, the cached listing is reused and the tree is not walked again.
+"""
+
+import json
+import os
+import sys
+
+ASSETS_ROOT = '../BitPlanner/Assets'
+CACHE_PATH = '.asset_manifest_cache.json'
+ICON_EXTENSION = '.png'
+
+# Icon fallbacks tried in order when the exact icon path is not in the manifest
+ICON_FALLBACKS = [
+    lambda icon: icon.replace('Other/', ''),
+]
+
+class AssetManifest:
+    """Set of asset paths (relative to the assets root, without extension)."""
+
+    def __init__(self, root, assets, dir_mtimes):
+        self.root = root
+        self.assets = assets
+        self.dir_mtimes = dir_mtimes
+        self.used = set()
+
+    def __contains__(self, asset):
+        return asset in self.assets
+
+    def __len__(self):
+        return len(self.assets)
+
+    def resolve_icon(self, icon):
+        """Return the asset name to use for an icon, or None if it is missing."""
+        if icon in self.assets:
+            self.used.add(icon)
+            return icon
+        for fallback in ICON_FALLBACKS:
+            candidate = fallback(icon)
+            if candidate in self.assets:
+                self.used.add(candidate)
+                return candidate
+        return None
+
+    def unreferenced_icons(self):
+        """
+        Assets in the item icon directories (those holding at least one
+        resolved icon) that no resolved icon referenced. Other parts of the
+        app may still use them, so this is not a list of files safe to delete.
+        """
+        icon_dirs = {asset.rpartition('/')[0] for asset in self.used}
+        return sorted(asset for asset in self.assets - self.used
+                      if asset.rpartition('/')[0] in icon_dirs)
+
+    def is_current(self):
+        """Check whether every walked directory still has its recorded mtime."""
+        if not self.dir_mtimes:
+            return False
+        for rel_dir, mtime in self.dir_mtimes.items():
+            try:
+                if os.stat(os.path.join(self.root, rel_dir)).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def save(self, path=CACHE_PATH):
+        with open(path, 'w') as f:
+            json.dump({
+                'root': self.root,
+                'dir_mtimes': self.dir_mtimes,
+                'assets': sorted(self.assets)
+            }, f)
+
+def scan_assets(root=ASSETS_ROOT):
+    """Walk the asset tree once and build a fresh manifest."""
+    assets = set()
+    dir_mtimes = {}
+    for dir_path, _, file_names in os.walk(root):
+        rel_dir = os.path.relpath(dir_path, root)
+        dir_mtimes[rel_dir] = os.stat(dir_path).st_mtime_ns
+        prefix = '' if rel_dir == '.' else rel_dir.replace(os.sep, '/') + '/'
+        for file_name in file_names:
+            if file_name.endswith(ICON_EXTENSION):
+                assets.add(prefix + file_name[:-len(ICON_EXTENSION)])
+    return AssetManifest(root, assets, dir_mtimes)
+
+def load_cached_manifest(root=ASSETS_ROOT, path=CACHE_PATH):
+    """Load the cached manifest, or None if it is missing or out of date."""
+    try:
+        with open(path, 'r') as f:
+            cached = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if cached.get('root') != root:
+        return None
+    manifest = AssetManifest(root, set(cached['assets']), cached['dir_mtimes'])
+    return manifest if manifest.is_current() else None
+
+def load_manifest(root=ASSETS_ROOT, path=CACHE_PATH):
+    """Return an up-to-date manifest, walking the tree only when the cache is stale."""
+    manifest = load_cached_manifest(root, path)
+    if manifest is None:
+        manifest = scan_assets(root)
+        if manifest.dir_mtimes:
+            manifest.save(path)
+    return manifest
+
+def main():
+    """Print the icons that are missing and the item icons crafting data doesn't refer to."""
+    crafting_data_path = sys.argv[1] if len(sys.argv) > 1 else '../BitPlanner/crafting_data.json'
+    with open(crafting_data_path, 'r') as f:
+        crafting_data = json.load(f)
+
+    manifest = load_manifest()
+    print(f"Asset manifest: {len(manifest)} assets")
+
+    missing_icons = set()
+    for item in crafting_data.values():
+        if manifest.resolve_icon(item['icon']) is None:
+            missing_icons.add(item['icon'])
+
+    if len(missing_icons) > 0:
+        print('Missing icons:')
+        for icon in sorted(missing_icons):
+            print('  ' + icon)
+
+    unreferenced = manifest.unreferenced_icons()
+    if len(unreferenced) > 0:
+        print('Item icon directory assets not referenced by crafting data:')
+        for asset in unreferenced:
+            print(f'  {asset}{ICON_EXTENSION}')
+
+if __name__ == "__main__":
+    main()
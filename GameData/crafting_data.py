@@ -2,6 +2,8 @@ import copy
 import json
 import os.path
 
+from asset_manifest import load_manifest
+
 root = 'BitCraft_GameData/server/region'
 crafting_recipes = json.load(open(f'{root}/crafting_recipe_desc.json'))
 extraction_recipes = json.load(open(f'{root}/extraction_recipe_desc.json'))
@@ -12,7 +14,6 @@ enemies = json.load(open(f'{root}/enemy_desc.json'))
 skills = json.load(open(f'{root}/skill_desc.json'))
 
 cargo_offset = 0xffffffff
-crafting_data = {}
 
 # Building type mapping
 building_type_to_name = {
@@ -141,101 +142,125 @@ def find_extraction_skill(id, is_cargo = False):
 			break
 	return skill
 
-print('Collecting items...')
-for item in items:
-	id = item['id']
-	if id > cargo_offset:
-		print(f'FATAL: item id {id} exceeds uint32 range')
-		os.exit(1)
-
-	crafting_data[id] = {
-		'name': item['name'],
-		'tier': item['tier'],
-		'rarity': item['rarity'][0],
-		'icon': item['icon_asset_name'].replace('GeneratedIcons/', ''),
-		'recipes': find_recipes(id),
-		'extraction_skill': find_extraction_skill(id)
-	}
-
-print('Collecing cargos...')
-for item in cargos:
-	id = item['id']
-	if id > cargo_offset:
-		print(f'FATAL: cargo id {id} exceeds uint32 range')
-		os.exit(1)
-
-	crafting_data[cargo_offset + id] = {
-		'name': item['name'],
-		'tier': item['tier'],
-		'rarity': item['rarity'][0],
-		'icon': item['icon_asset_name'].replace('GeneratedIcons/', ''),
-		'recipes': find_recipes(id, True),
-		'extraction_skill': find_extraction_skill(id, True)
-	}
-
-print('Checking icons...')
-missing_icons = []
-for item in crafting_data.values():
-	icon = item['icon']
-	if not os.path.exists(f'../BitPlanner/Assets/{icon}.png'):
-		if os.path.exists(f'../BitPlanner/Assets/{icon.replace('Other/', '')}.png'):
-			item['icon'] = icon.replace('Other/', '')
+def get_list_possibilities(item_list, known_ids):
+	"""Build per-target quantity -> probability maps for an item list"""
+	# Chances are absolute when they add up to at most 1 (the rest drops nothing);
+	# larger totals mean the chances are weights and get divided by the total
+	total_weight = sum(possibility[0] for possibility in item_list['possibilities'])
+	scale = 1 / total_weight if total_weight > 1 else 1
+
+	possible_recipes = {}
+	for possibility in item_list['possibilities']:
+		chance = possibility[0] * scale
+
+		for details in possibility[1]:
+			target_id = details[0] + (cargo_offset if details[2][0] == 1 else 0)
+			if not target_id in known_ids:
+				continue
+			if not target_id in possible_recipes.keys():
+				possible_recipes[target_id] = {}
+
+			quantity = details[1]
+			if not quantity in possible_recipes[target_id]:
+				possible_recipes[target_id][quantity] = 0.0
+			possible_recipes[target_id][quantity] += chance
+	return possible_recipes
+
+def deduplicate_recipes(recipes):
+	"""Remove duplicate recipes and sort the rest in a stable order"""
+	# Sorting the serialized recipes first breaks ties in the (stable) sort below,
+	# so the order never depends on set iteration order
+	deduplicated_recipes = sorted({json.dumps(r, sort_keys=True) for r in recipes})
+	recipes = [json.loads(r) for r in deduplicated_recipes]
+	recipes.sort(key=lambda recipe: recipe['consumed_items'][0]['quantity'] if len(recipe['consumed_items']) > 0 else 0)
+	return recipes
+
+def generate_crafting_data():
+	crafting_data = {}
+
+	print('Collecting items...')
+	for item in items:
+		id = item['id']
+		if id > cargo_offset:
+			print(f'FATAL: item id {id} exceeds uint32 range')
+			os.exit(1)
+
+		crafting_data[id] = {
+			'name': item['name'],
+			'tier': item['tier'],
+			'rarity': item['rarity'][0],
+			'icon': item['icon_asset_name'].replace('GeneratedIcons/', ''),
+			'recipes': find_recipes(id),
+			'extraction_skill': find_extraction_skill(id)
+		}
+
+	print('Collecing cargos...')
+	for item in cargos:
+		id = item['id']
+		if id > cargo_offset:
+			print(f'FATAL: cargo id {id} exceeds uint32 range')
+			os.exit(1)
+
+		crafting_data[cargo_offset + id] = {
+			'name': item['name'],
+			'tier': item['tier'],
+			'rarity': item['rarity'][0],
+			'icon': item['icon_asset_name'].replace('GeneratedIcons/', ''),
+			'recipes': find_recipes(id, True),
+			'extraction_skill': find_extraction_skill(id, True)
+		}
+
+	print('Checking icons...')
+	asset_manifest = load_manifest()
+	missing_icons = []
+	for item in crafting_data.values():
+		icon = asset_manifest.resolve_icon(item['icon'])
+		if icon is not None:
+			item['icon'] = icon
 		else:
-			missing_icons.append(icon)
-if len(missing_icons) > 0:
-	print('Missing icons:')
-	for icon in sorted(set(missing_icons)):
-		print('  ' + icon)
-
-print('Reorganizing recipes...')
-for item in items:
-	id = item['id']
-	list_id = item['item_list_id']
-	if list_id == 0 or item['tier'] < 0:
-		continue
-	del crafting_data[id]
-
-	for item_list in item_lists:
-		if item_list['id'] != list_id:
+			missing_icons.append(item['icon'])
+	if len(missing_icons) > 0:
+		print('Missing icons:')
+		for icon in sorted(set(missing_icons)):
+			print('  ' + icon)
+
+	print('Reorganizing recipes...')
+	for item in items:
+		id = item['id']
+		list_id = item['item_list_id']
+		if list_id == 0 or item['tier'] < 0:
 			continue
+		del crafting_data[id]
+
+		for item_list in item_lists:
+			if item_list['id'] != list_id:
+				continue
+
+			possible_recipes = get_list_possibilities(item_list, crafting_data.keys())
 
-		possible_recipes = {}
-		for possibility in item_list['possibilities']:
-			chance = possibility[0]
+			recipes = find_recipes(id)
+			skill = find_extraction_skill(id)
 
-			for details in possibility[1]:
-				target_id = details[0]
+			for target_id, possibilities in possible_recipes.items():
 				if not target_id in crafting_data.keys():
+					print(f'Warning: no ID {target_id} in crafting data')
 					continue
-				if not target_id in possible_recipes.keys():
-					possible_recipes[target_id] = {}
+				new_recipes = copy.deepcopy(recipes)
+				for recipe in new_recipes:
+					recipe['possibilities'] = {k: possibilities[k] for k in sorted(possibilities)}
+				crafting_data[target_id]['recipes'].extend(new_recipes)
+				if crafting_data[target_id]['extraction_skill'] == -1:
+					crafting_data[target_id]['extraction_skill'] = skill
+			break
 
-				quantity = details[1]
-				if not quantity in possible_recipes[target_id]:
-					possible_recipes[target_id][quantity] = 0.0
-				possible_recipes[target_id][quantity] += chance
+	print('Cleanup...')
+	for item in crafting_data.values():
+		item['recipes'] = deduplicate_recipes(item['recipes'])
 
-		recipes = find_recipes(id)
-		skill = find_extraction_skill(id)
+	return crafting_data
 
-		for target_id, possibilities in possible_recipes.items():
-			if not target_id in crafting_data.keys():
-				print(f'Warning: no ID {target_id} in crafting data')
-				continue
-			new_recipes = copy.deepcopy(recipes)
-			for recipe in new_recipes:
-				recipe['possibilities'] = {k: possibilities[k] for k in sorted(possibilities)}
-			crafting_data[target_id]['recipes'].extend(new_recipes)
-			if crafting_data[target_id]['extraction_skill'] == -1:
-				crafting_data[target_id]['extraction_skill'] = skill
-		break
-
-print('Cleanup...')
-for item in crafting_data.values():
-	recipes = item['recipes']
-	deduplicated_recipes = {json.dumps(r, sort_keys=True) for r in recipes}
-	recipes = [json.loads(r) for r in deduplicated_recipes]
-	recipes.sort(key=lambda recipe: recipe['consumed_items'][0]['quantity'] if len(recipe['consumed_items']) > 0 else 0)
-	item['recipes'] = recipes
+def write_crafting_data(crafting_data):
+	json.dump(crafting_data, open('../BitPlanner/crafting_data.json', 'w'), indent=2)
 
-json.dump(crafting_data, open('../BitPlanner/crafting_data.json', 'w'), indent=2)
+if __name__ == '__main__':
+	write_crafting_data(generate_crafting_data())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Web Data Export
+Writes the crafting data for the static web app as minified shards grouped by
+tier band and fixed id ranges, plus a small manifest with the item list. Shard
+boundaries depend only on the tier and id, so adding or removing an item only
+changes the shard it falls in. Shard file names carry a hash of their content,
+so an unchanged shard keeps its URL across data updates. Compression and
+Cache-Control are left to the host (GitHub Pages gzips responses itself and
+sets its own caching); manifest.json is fetched with no-cache by the app.
+"""
+
+import bisect
+import copy
+import filecmp
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+
+OUTPUT_DIR = '../bitcraft-planner/public/data'
+MANIFEST_NAME = 'manifest.json'
+SHARD_PREFIX = 'recipes-'
+# Item ids are small sequential numbers, larger hashed ids, or cargo ids offset
+# past 2^32, one range each
+ID_BREAKPOINTS = [0, 10 ** 8, 2 ** 31, 2 ** 32]
+# Untiered (-1) and tier 0 items, and the few items above tier 10, are too
+# sparse for shards of their own and share the nearest tier band
+MIN_SHARD_TIER = 0
+MAX_SHARD_TIER = 10
+MANIFEST_FIELDS = ['name', 'tier', 'rarity', 'icon', 'extraction_skill']
+
+def minify(data):
+    # Sorted keys keep the bytes (and so the hashes) independent of dict insertion order
+    return json.dumps(data, separators=(',', ':'), sort_keys=True, ensure_ascii=False).encode('utf-8')
+
+def id_range(item_id):
+    """The fixed [low, high) id range an item id falls in; high is None for the last one."""
+    position = bisect.bisect_right(ID_BREAKPOINTS, int(item_id)) - 1
+    high = ID_BREAKPOINTS[position + 1] if position + 1 < len(ID_BREAKPOINTS) else None
+    return ID_BREAKPOINTS[position], high
+
+def shard_tier(tier):
+    """The tier band an item's tier is sharded under."""
+    return min(max(tier, MIN_SHARD_TIER), MAX_SHARD_TIER)
+
+def shard_items(crafting_data):
+    """Group item ids by tier band and fixed id range."""
+    groups = {}
+    for item_id, item in crafting_data.items():
+        groups.setdefault((shard_tier(item['tier']), id_range(item_id)), []).append(item_id)
+    return [(tier, bounds, sorted(groups[(tier, bounds)], key=int))
+            for tier, bounds in sorted(groups, key=lambda key: (key[0], key[1][0]))]
+
+def write_if_changed(path, content):
+    """Write a file unless an identical one is already there; returns True if written."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(content)
+    return True
+
+def export_web_data(crafting_data, output_dir=OUTPUT_DIR, verbose=True):
+    """Write hashed shards and the manifest; returns the manifest."""
+    os.makedirs(output_dir, exist_ok=True)
+    shards = []
+    items = {}
+    written = 0
+
+    for tier, (low, high), ids in shard_items(crafting_data):
+        content = minify({item_id: crafting_data[item_id] for item_id in ids})
+        digest = hashlib.sha256(content).hexdigest()[:12]
+        file_name = f'{SHARD_PREFIX}t{tier}.{low}-{"max" if high is None else high}.{digest}.json'
+
+        written += write_if_changed(os.path.join(output_dir, file_name), content)
+
+        for item_id in ids:
+            items[item_id] = [crafting_data[item_id][field] for field in MANIFEST_FIELDS] + [len(shards)]
+        shards.append({
+            'file': file_name,
+            'tier': tier,
+            'ids': [low, high],
+            'count': len(ids),
+            'bytes': len(content)
+        })
+
+    manifest = {
+        'fields': MANIFEST_FIELDS + ['shard'],
+        'shards': shards,
+        'items': items
+    }
+    manifest_content = minify(manifest)
+    write_if_changed(os.path.join(output_dir, MANIFEST_NAME), manifest_content)
+
+    # Shards no longer referenced by the manifest are stale
+    current = {shard['file'] for shard in shards}
+    removed = 0
+    for file_name in os.listdir(output_dir):
+        if file_name.startswith(SHARD_PREFIX) and file_name not in current:
+            os.remove(os.path.join(output_dir, file_name))
+            removed += 1
+
+    if verbose:
+        print(f'Exported {len(items)} items in {len(shards)} shards ({written} changed, {removed} stale files removed)')
+        print(f'Manifest: {len(manifest_content)} bytes')
+    return manifest
+
+def check_reproducible(crafting_data, sort_recipes):
+    """
+    Export the data twice, the second time with every item's recipes shuffled
+    before `sort_recipes` puts them back in order, and check that both runs
+    write the same bytes. Returns True when they do.
+    """
+    shuffled = copy.deepcopy(crafting_data)
+    rng = random.Random(0)
+    for item in shuffled.values():
+        rng.shuffle(item['recipes'])
+        item['recipes'] = sort_recipes(item['recipes'])
+
+    with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+        export_web_data(crafting_data, first, verbose=False)
+        export_web_data(shuffled, second, verbose=False)
+        names = sorted(os.listdir(first))
+        match, mismatch, errors = filecmp.cmpfiles(first, second, names, shallow=False)
+        identical = names == sorted(os.listdir(second)) and not mismatch and not errors
+
+    print(f'Web data export is {"reproducible" if identical else "NOT reproducible"} ({len(names)} files compared)')
+    return identical
+
+def main():
+    """Usage: export_web_data.py [crafting_data.json] [output_dir] | --check"""
+    if len(sys.argv) > 1 and sys.argv[1] == '--check':
+        # Imported here because crafting_data loads the game tables on import
+        from crafting_data import deduplicate_recipes
+        with open('../BitPlanner/crafting_data.json', 'r') as f:
+            return 0 if check_reproducible(json.load(f), deduplicate_recipes) else 1
+    input_path = sys.argv[1] if len(sys.argv) > 1 else '../BitPlanner/crafting_data.json'
+    output_dir = sys.argv[2] if len(sys.argv) > 2 else OUTPUT_DIR
+    with open(input_path, 'r') as f:
+        crafting_data = json.load(f)
+    export_web_data(crafting_data, output_dir)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
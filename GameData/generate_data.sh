@@ -1,7 +1,6 @@
 #!/bin/bash
 
-python3 ./crafting_data.py
-python3 ./travelers_data.py
+python3 ./pipeline.py || exit 1
 
 echo "Writing game data version..."
 cd BitCraft_GameData
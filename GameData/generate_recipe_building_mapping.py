@@ -178,6 +178,11 @@ def main():
         print("❌ Failed to load crafting data")
         return
     
+    run_mapping(crafting_data)
+
+def run_mapping(crafting_data):
+    """Generate and export all mappings from an already loaded crafting model."""
+    
     print("🔄 Generating recipe-building mappings...")
     recipe_to_building, building_to_recipes, item_building_mapping = generate_recipe_building_mapping(crafting_data)
     
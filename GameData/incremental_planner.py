@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Incremental Material Planner
+Keeps per-item demand, inventory and craft counts for a crafting plan over the
+crafting_data.json recipe graph. Changing a target quantity or an inventory
+line only pushes the resulting change in crafts down the affected part of the
+graph, so an update costs as much as the part of the plan it actually changes.
+The figures are not the web calculator's: inventory is netted at every
+intermediate item and crafts are rounded up on the total demand for an item,
+while useItemsStore.getRequiredMaterials rounds up along each path and only
+subtracts inventory from the final totals. Loops are cut differently too (see
+RecipeGraph).
+Run with --check to compare it against full recomputation on random edits.
+"""
+
+import heapq
+import json
+import random
+import sys
+import time
+
+class RecipeGraph:
+    """
+    Items and the ingredient edges of one chosen recipe per item (the first
+    one unless overridden). The game data contains a few recipe loops; one
+    depth-first pass over all items drops a single edge per loop for the whole
+    graph. The web calculator instead stops at an item already on the current
+    expansion path, so which ingredient gets cut depends on where it started,
+    and quantities for items inside a loop can differ from it.
+    """
+
+    def __init__(self, crafting_data, recipe_choice=None):
+        recipe_choice = recipe_choice or {}
+        self.ids = list(crafting_data.keys())
+        self.index = {item_id: i for i, item_id in enumerate(self.ids)}
+        self.output = [0] * len(self.ids)
+        self.ingredients = [[] for _ in self.ids]
+
+        for i, item_id in enumerate(self.ids):
+            recipes = crafting_data[item_id].get('recipes', [])
+            if not recipes:
+                continue
+            recipe_idx = recipe_choice.get(item_id, 0)
+            recipe = recipes[recipe_idx] if recipe_idx < len(recipes) else recipes[0]
+            self.output[i] = max(1, recipe.get('output_quantity', 1))
+            for ingredient in recipe['consumed_items']:
+                child = self.index.get(str(ingredient['id']))
+                if child is not None:
+                    self.ingredients[i].append((child, ingredient['quantity']))
+
+        self.order = self.break_cycles()
+        self.rank = [0] * len(self.ids)
+        for position, i in enumerate(self.order):
+            self.rank[i] = position
+
+        self.consumers = [[] for _ in self.ids]
+        for parent, edges in enumerate(self.ingredients):
+            for child, quantity in edges:
+                self.consumers[child].append((parent, quantity))
+
+    def break_cycles(self):
+        """Drop the edges that close a loop in one DFS and return the items with every consumer before its ingredients."""
+        state = [0] * len(self.ids)  # 0 unvisited, 1 on the DFS stack, 2 done
+        postorder = []
+        for start in range(len(self.ids)):
+            if state[start]:
+                continue
+            state[start] = 1
+            stack = [(start, 0)]
+            while stack:
+                node, edge = stack[-1]
+                edges = self.ingredients[node]
+                if edge == len(edges):
+                    stack.pop()
+                    state[node] = 2
+                    postorder.append(node)
+                    continue
+                stack[-1] = (node, edge + 1)
+                child = edges[edge][0]
+                if state[child] == 1:
+                    edges[edge] = None
+                elif state[child] == 0:
+                    state[child] = 1
+                    stack.append((child, 0))
+        for i, edges in enumerate(self.ingredients):
+            self.ingredients[i] = [edge for edge in edges if edge is not None]
+        return postorder[::-1]
+
+    def crafts_for(self, i, demand, inventory):
+        """Crafts needed at item i to cover whatever demand the inventory doesn't."""
+        if self.output[i] == 0:
+            return 0
+        return -(-max(0, demand - inventory) // self.output[i])
+
+class IncrementalPlanner:
+    """Plan state that is updated by propagating deltas instead of recomputing."""
+
+    def __init__(self, graph):
+        self.graph = graph
+        count = len(graph.ids)
+        self.targets = [0] * count
+        self.inventory = [0] * count
+        self.demand = [0] * count
+        self.crafts = [0] * count
+        self.last_touched = 0
+
+    def set_target(self, item_id, quantity):
+        i = self.graph.index[item_id]
+        self.demand[i] += quantity - self.targets[i]
+        self.targets[i] = quantity
+        return self.propagate(i)
+
+    def set_inventory(self, item_id, quantity):
+        i = self.graph.index[item_id]
+        self.inventory[i] = quantity
+        return self.propagate(i)
+
+    def propagate(self, start):
+        """
+        Recompute crafts at `start` and push any change to its ingredients.
+        Items are visited in topological order so each is settled once per
+        update even when several changed consumers share it. Returns the
+        number of items visited.
+        """
+        graph = self.graph
+        queue = [(graph.rank[start], start)]
+        queued = {start}
+        touched = 0
+        while queue:
+            _, i = heapq.heappop(queue)
+            queued.discard(i)
+            touched += 1
+            crafts = graph.crafts_for(i, self.demand[i], self.inventory[i])
+            delta = crafts - self.crafts[i]
+            if delta == 0:
+                continue
+            self.crafts[i] = crafts
+            for child, quantity in graph.ingredients[i]:
+                self.demand[child] += delta * quantity
+                if child not in queued:
+                    queued.add(child)
+                    heapq.heappush(queue, (graph.rank[child], child))
+        self.last_touched = touched
+        return touched
+
+    def affected_targets(self, item_id):
+        """Targets whose plan uses the item, found by walking consumer edges upwards."""
+        graph = self.graph
+        start = graph.index[item_id]
+        seen = {start}
+        stack = [start]
+        while stack:
+            for parent, _ in graph.consumers[stack.pop()]:
+                if parent not in seen and self.crafts[parent] > 0:
+                    seen.add(parent)
+                    stack.append(parent)
+        return [graph.ids[i] for i in seen if self.targets[i] > 0]
+
+    def requirements(self):
+        """Needed, held and missing quantities plus crafts for every item in the plan."""
+        graph = self.graph
+        result = {}
+        for i, demand in enumerate(self.demand):
+            if demand <= 0:
+                continue
+            result[graph.ids[i]] = {
+                'needed': demand,
+                'have': min(demand, self.inventory[i]),
+                'missing': max(0, demand - self.inventory[i]),
+                'crafts': self.crafts[i],
+                'is_base_item': graph.output[i] == 0
+            }
+        return result
+
+def full_recompute(graph, targets, inventory):
+    """
+    Demand and crafts for every item, computed from scratch in topological order.
+    It shares the graph, crafts_for and the cycle cutting with the planner, so
+    comparing the two only checks delta propagation, not those.
+    """
+    demand = list(targets)
+    crafts = [0] * len(graph.ids)
+    for i in graph.order:
+        crafts[i] = graph.crafts_for(i, demand[i], inventory[i])
+        if crafts[i]:
+            for child, quantity in graph.ingredients[i]:
+                demand[child] += crafts[i] * quantity
+    return demand, crafts
+
+def check_equivalence(crafting_data, steps=2000, seed=0):
+    """Apply random target and inventory edits and compare every state with a full recompute."""
+    rng = random.Random(seed)
+    graph = RecipeGraph(crafting_data)
+    planner = IncrementalPlanner(graph)
+    craftable = [item_id for i, item_id in enumerate(graph.ids) if graph.output[i]]
+
+    incremental_time = 0.0
+    full_time = 0.0
+    touched = 0
+    for step in range(steps):
+        planned = [graph.ids[i] for i, demand in enumerate(planner.demand) if demand > 0]
+        start = time.perf_counter()
+        if not planned or rng.random() < 0.3:
+            planner.set_target(rng.choice(craftable), rng.choice([0, 1, 1, 5, 20, 100]))
+        else:
+            planner.set_inventory(rng.choice(planned), rng.randint(0, 200))
+        incremental_time += time.perf_counter() - start
+        touched += planner.last_touched
+
+        start = time.perf_counter()
+        demand, crafts = full_recompute(graph, planner.targets, planner.inventory)
+        full_time += time.perf_counter() - start
+        if demand != planner.demand or crafts != planner.crafts:
+            print(f'Mismatch after step {step}')
+            return False
+
+    print(f'{steps} random edits matched full recomputation over {len(graph.ids)} items')
+    print(f'  incremental: {incremental_time / steps * 1e6:.1f} us/update, {touched / steps:.1f} items visited')
+    print(f'  full:        {full_time / steps * 1e6:.1f} us/update, {len(graph.ids)} items visited')
+    return True
+
+def main():
+    """Usage: incremental_planner.py --check [steps] [seed]"""
+    if len(sys.argv) < 2 or sys.argv[1] != '--check':
+        print(main.__doc__)
+        return 1
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    with open('../BitPlanner/crafting_data.json', 'r') as f:
+        crafting_data = json.load(f)
+    return 0 if check_equivalence(crafting_data, steps, seed) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Data Generation Pipeline
+Runs every data generation stage in a single process. The crafting model is
+built once and handed to the downstream stages in memory instead of being
+re-read from crafting_data.json, and stages that don't depend on each other
+run concurrently.
+"""
+
+import io
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import crafting_data
+import export_web_data
+import generate_recipe_building_mapping
+import recipe_building_analysis
+import travelers_data
+import validate_data
+
+class GateFailed(Exception):
+    """Raised by a gate stage to stop the pipeline before anything is written."""
+
+def build_crafting_model(results):
+    model = crafting_data.generate_crafting_data()
+    # Downstream stages expect the keys the JSON file would have
+    return {str(item_id): item for item_id, item in model.items()}
+
+def write_crafting_model(results):
+    crafting_data.write_crafting_data(results['crafting'])
+
+def build_travelers_data(results):
+    travelers = travelers_data.generate_travelers_data(results['crafting'])
+    travelers_data.write_travelers_data(travelers)
+    return travelers
+
+def export_web_app_data(results):
+    return export_web_data.export_web_data(results['crafting'])
+
+def validate_generated_data(results):
+    report = validate_data.run_validation(results['crafting'])
+    if report['summary']['regressions'] > 0:
+        raise GateFailed(f"validation found {report['summary']['regressions']} regressions")
+    return report
+
+def build_recipe_building_mapping(results):
+    generate_recipe_building_mapping.run_mapping(results['crafting'])
+
+def build_recipe_building_analysis(results):
+    building_mapping = recipe_building_analysis.load_building_mapping()
+    recipe_building_analysis.run_analysis(results['crafting'], building_mapping)
+
+# Stage name -> (dependencies, function taking the results of finished stages).
+# Every stage that writes files depends on the validation gate.
+STAGES = {
+    'crafting': ([], build_crafting_model),
+    'validation': (['crafting'], validate_generated_data),
+    'crafting_output': (['validation'], write_crafting_model),
+    'travelers': (['validation'], build_travelers_data),
+    'web_data': (['validation'], export_web_app_data),
+    'recipe_building_mapping': (['validation'], build_recipe_building_mapping),
+    'recipe_building_analysis': (['validation'], build_recipe_building_analysis),
+}
+
+class StageOutput(io.TextIOBase):
+    """Routes prints from stage threads into per-stage buffers so concurrent stages don't interleave."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+def run_stage(name, stage, results, output):
+    output.local.buffer = io.StringIO()
+    try:
+        return stage(results)
+    finally:
+        captured = output.local.buffer.getvalue()
+        output.local.buffer = None
+        output.write(f'=== {name} ===\n{captured}')
+
+def run_pipeline(stages=STAGES, max_workers=None):
+    """
+    Run stages as a DAG, starting each one as soon as its dependencies finish.
+    A stage that becomes ready while nothing else can run is run on the main
+    thread with its output printed live; only concurrent stages are buffered.
+    """
+    results = {}
+    pending = dict(stages)
+    running = {}
+    output = StageOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                ready = [name for name, (deps, _) in pending.items() if all(dep in results for dep in deps)]
+                if len(ready) == 1 and not running:
+                    name = ready[0]
+                    print(f'=== {name} ===')
+                    results[name] = pending.pop(name)[1](results)
+                    continue
+                for name in ready:
+                    running[executor.submit(run_stage, name, pending.pop(name)[1], results, output)] = name
+                if not running:
+                    raise RuntimeError(f'Unresolvable stage dependencies: {sorted(pending)}')
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+    finally:
+        sys.stdout = output.stream
+    return results
+
+if __name__ == '__main__':
+    try:
+        run_pipeline()
+    except GateFailed as error:
+        print(f'Pipeline stopped, nothing was written: {error}')
+        sys.exit(1)
@@ -14,14 +14,20 @@ def load_data():
     try:
         with open('../BitPlanner/crafting_data.json', 'r') as f:
             crafting_data = json.load(f)
-        
-        with open('building_requirements_mapping.json', 'r') as f:
-            building_mapping = json.load(f)
-        
-        return crafting_data, building_mapping
     except FileNotFoundError as e:
         print(f"Error: Could not find required data files: {e}")
         return None, None
+    
+    return crafting_data, load_building_mapping()
+
+def load_building_mapping():
+    """Load the building requirements mapping."""
+    try:
+        with open('building_requirements_mapping.json', 'r') as f:
+            return json.load(f)
+    except FileNotFoundError as e:
+        print(f"Error: Could not find required data files: {e}")
+        return None
 
 def analyze_recipe_building_correlation(crafting_data, building_mapping):
     """Analyze the correlation between recipes and buildings."""
@@ -190,6 +196,11 @@ def main():
         print("❌ Could not load data files. Please ensure crafting_data.json exists.")
         return
     
+    run_analysis(crafting_data, building_mapping)
+
+def run_analysis(crafting_data, building_mapping):
+    """Run the full analysis on an already loaded crafting model."""
+    
     print(f"✅ Loaded {len(crafting_data)} items with crafting data")
     print()
     
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Generated Data Validation
+Checks the referential integrity of the generated crafting data against the
+game data it was built from. All id sets are built once up front and every
+reference is checked in a single pass, so the whole dataset validates in
+milliseconds. Issues already recorded in the baseline file are reported but
+only new ones count as regressions and produce a nonzero exit code.
+"""
+
+import json
+import sys
+from collections import Counter
+
+root = 'BitCraft_GameData/server/region'
+cargo_offset = 0xffffffff
+BASELINE_PATH = 'validation_baseline.json'
+REPORT_PATH = 'validation_report.json'
+
+def load_game_data():
+    """Load the raw game tables the generated data refers to."""
+    tables = {}
+    for name in ['item_desc', 'item_list_desc', 'skill_desc', 'building_type_desc',
+                 'crafting_recipe_desc', 'npc_desc', 'traveler_task_desc']:
+        with open(f'{root}/{name}.json', 'r') as f:
+            tables[name] = json.load(f)
+    return tables
+
+def build_indexes(crafting_data, game_data):
+    """Build every id set and lookup the checks need, once."""
+    return {
+        'item_ids': set(crafting_data.keys()),
+        'skill_ids': {skill['id'] for skill in game_data['skill_desc']},
+        'building_type_ids': {building_type['id'] for building_type in game_data['building_type_desc']},
+        'item_lists': {item_list['id']: item_list for item_list in game_data['item_list_desc']},
+    }
+
+def issue(check, source, ref):
+    return {'check': check, 'source': source, 'ref': ref}
+
+def validate(crafting_data, game_data):
+    """Return the list of integrity issues; crafting_data keys are strings as in the JSON file."""
+    indexes = build_indexes(crafting_data, game_data)
+    item_ids = indexes['item_ids']
+    skill_ids = indexes['skill_ids']
+    issues = []
+
+    for item_id, item in crafting_data.items():
+        if item['extraction_skill'] != -1 and item['extraction_skill'] not in skill_ids:
+            issues.append(issue('extraction_skill', f'item {item_id}', item['extraction_skill']))
+        for recipe in item['recipes']:
+            for consumed in recipe['consumed_items']:
+                if str(consumed['id']) not in item_ids:
+                    issues.append(issue('consumed_item', f'item {item_id}', consumed['id']))
+            skill_id = recipe['level_requirements'][0]
+            if skill_id != 0 and skill_id not in skill_ids:
+                issues.append(issue('recipe_skill', f'item {item_id}', skill_id))
+
+    for recipe in game_data['crafting_recipe_desc']:
+        building_requirement = recipe.get('building_requirement', [])
+        if len(building_requirement) >= 2 and isinstance(building_requirement[1], dict):
+            building_type = building_requirement[1].get('building_type')
+            if building_type and building_type not in indexes['building_type_ids']:
+                issues.append(issue('building_type', f'recipe {recipe["id"]}', building_type))
+
+    checked_lists = set()
+    list_targets = set()
+    for item in game_data['item_desc']:
+        list_id = item['item_list_id']
+        if list_id == 0 or item['tier'] < 0:
+            continue
+        item_list = indexes['item_lists'].get(list_id)
+        if item_list is None:
+            issues.append(issue('item_list', f'item {item["id"]}', list_id))
+            continue
+        if list_id in checked_lists:
+            continue
+        checked_lists.add(list_id)
+        for possibility in item_list['possibilities']:
+            for details in possibility[1]:
+                # The item type flag marks cargo, which is keyed past cargo_offset
+                target_id = details[0] + (cargo_offset if details[2][0] == 1 else 0)
+                list_targets.add(str(target_id))
+                if str(target_id) not in item_ids:
+                    issues.append(issue('item_list_target', f'item list {list_id}', target_id))
+
+    # Loot recipes must only end up on items some list actually drops
+    for item_id, item in crafting_data.items():
+        if item_id not in list_targets and any(recipe['possibilities'] for recipe in item['recipes']):
+            issues.append(issue('item_list_recipe', f'item {item_id}', item['name']))
+
+    for npc in game_data['npc_desc']:
+        for skill_id in npc['task_skill_check']:
+            if skill_id not in skill_ids:
+                issues.append(issue('traveler_skill', f'npc {npc["name"]}', skill_id))
+
+    for task in game_data['traveler_task_desc']:
+        skill_id = task['level_requirement']['skill_id']
+        if skill_id not in skill_ids:
+            issues.append(issue('traveler_skill', f'task {task["id"]}', skill_id))
+        for item in task['required_items']:
+            item_id = item[0] + (cargo_offset if item[2][0] == 1 else 0)
+            if str(item_id) not in item_ids:
+                issues.append(issue('traveler_required_item', f'task {task["id"]}', item_id))
+
+    return issues
+
+def issue_key(entry):
+    return f"{entry['check']}|{entry['source']}|{entry['ref']}"
+
+def build_report(issues, baseline_keys):
+    """Structure the issues into a report, separating known issues from regressions."""
+    regressions = [entry for entry in issues if issue_key(entry) not in baseline_keys]
+    return {
+        'summary': {
+            'total_issues': len(issues),
+            'regressions': len(regressions),
+            'by_check': dict(Counter(entry['check'] for entry in issues))
+        },
+        'regressions': regressions,
+        'issues': issues
+    }
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, 'r') as f:
+            return set(json.load(f))
+    except FileNotFoundError:
+        return set()
+
+def save_baseline(issues, path=BASELINE_PATH):
+    with open(path, 'w') as f:
+        json.dump(sorted({issue_key(entry) for entry in issues}), f, indent=2)
+
+def run_validation(crafting_data, game_data=None):
+    """Validate, write the report and print a summary. Returns the report."""
+    if game_data is None:
+        game_data = load_game_data()
+    report = build_report(validate(crafting_data, game_data), load_baseline())
+
+    with open(REPORT_PATH, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    summary = report['summary']
+    print(f"Validation: {summary['total_issues']} issues, {summary['regressions']} regressions")
+    for check, count in sorted(summary['by_check'].items()):
+        print(f'  {check}: {count}')
+    for entry in report['regressions']:
+        print(f"  REGRESSION {entry['check']}: {entry['source']} -> {entry['ref']}")
+    return report
+
+def main():
+    """Validate ../BitPlanner/crafting_data.json; pass --update-baseline to accept current issues."""
+    with open('../BitPlanner/crafting_data.json', 'r') as f:
+        crafting_data = json.load(f)
+    game_data = load_game_data()
+
+    if '--update-baseline' in sys.argv:
+        issues = validate(crafting_data, game_data)
+        save_baseline(issues)
+        print(f'Baseline updated with {len(issues)} issues')
+        return 0
+
+    report = run_validation(crafting_data, game_data)
+    return 1 if report['summary']['regressions'] > 0 else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Probabilistic Yield Engine
+Turns the `possibilities` maps of item-list recipes (quantity -> probability,
+already divided by the list's total weight in crafting_data.py, with the
+remaining probability yielding nothing) into exact expected yields and
+variances, and runs batched Monte Carlo simulations of how many crafts are
+needed to reach a target quantity. Recipes are grouped by their distribution
+so every distinct distribution is sampled once, all of them in one vectorized
+batch. Requires NumPy.
+"""
+
+import json
+import sys
+import time
+import warnings
+
+import numpy as np
+
+def collect_loot_recipes(crafting_data):
+    """Return (item_id, recipe_index, recipe) for every recipe with possibilities."""
+    loot_recipes = []
+    for item_id, item in crafting_data.items():
+        for recipe_idx, recipe in enumerate(item.get('recipes', [])):
+            if recipe.get('possibilities'):
+                loot_recipes.append((item_id, recipe_idx, recipe))
+    return loot_recipes
+
+class YieldTable:
+    """Loot recipes packed into padded per-distribution outcome arrays."""
+
+    def __init__(self, loot_recipes):
+        self.recipes = [(item_id, recipe_idx) for item_id, recipe_idx, _ in loot_recipes]
+
+        # A single craft opens output_quantity independent draws from the list
+        distribution_index = {}
+        recipe_distribution = []
+        draws_per_craft = []
+        for _, _, recipe in loot_recipes:
+            key = tuple(sorted((int(quantity), chance) for quantity, chance in recipe['possibilities'].items()))
+            recipe_distribution.append(distribution_index.setdefault(key, len(distribution_index)))
+            draws_per_craft.append(recipe.get('output_quantity', 1))
+
+        width = max((len(key) for key in distribution_index), default=0) + 1
+        self.values = np.zeros((len(distribution_index), width), dtype=np.int64)
+        self.probs = np.zeros((len(distribution_index), width), dtype=np.float64)
+        for key, d in distribution_index.items():
+            quantities, chances = zip(*key)
+            self.values[d, 1:len(key) + 1] = quantities
+            self.probs[d, 1:len(key) + 1] = chances
+            if sum(chances) > 1 + 1e-9:
+                raise ValueError(f'Possibilities {dict(key)} add up to more than 1, regenerate crafting_data.json')
+            # Column 0 is the "nothing dropped" outcome
+            self.probs[d, 0] = max(0.0, 1.0 - sum(chances))
+        # Only absorbs floating point rounding in the sums
+        self.probs /= self.probs.sum(axis=1, keepdims=True)
+
+        self.recipe_distribution = np.array(recipe_distribution, dtype=np.int64)
+        self.draws_per_craft = np.array(draws_per_craft, dtype=np.int64)
+
+        # Recipes sharing a distribution and draws per craft share simulation results
+        groups, self.recipe_group = np.unique(
+            np.stack([self.recipe_distribution, self.draws_per_craft], axis=1), axis=0, return_inverse=True)
+        self.recipe_group = self.recipe_group.ravel()
+        self.group_distribution, self.group_draws = groups[:, 0], groups[:, 1]
+
+    def __len__(self):
+        return len(self.recipes)
+
+def draw_moments(table):
+    """Exact mean and variance of a single draw for every distinct distribution."""
+    mean = (table.probs * table.values).sum(axis=1)
+    variance = (table.probs * table.values ** 2).sum(axis=1) - mean ** 2
+    return mean, variance
+
+def expected_yields(table):
+    """Exact expected output and variance per craft for every loot recipe."""
+    mean, variance = draw_moments(table)
+    draws = table.draws_per_craft
+    return mean[table.recipe_distribution] * draws, variance[table.recipe_distribution] * draws
+
+def simulate_draws_to_target(table, target, trials=1000, max_draws=100000, batch_size=1 << 22, rng=None):
+    """
+    Monte Carlo number of draws needed to collect `target` items, shape
+    (distributions, trials). Single-outcome distributions are sampled in closed
+    form; all still-running trials of the others are sampled together as one
+    ragged batch, each trial drawing about as many
+    samples as its distribution is expected to still need, capped at
+    batch_size samples per iteration. Trials that need more than max_draws
+    draws report -1.
+    """
+    if target < 1:
+        raise ValueError(f'Target quantity must be at least 1, got {target}')
+    rng = np.random.default_rng() if rng is None else rng
+    count, width = table.probs.shape
+    cdf = np.cumsum(table.probs, axis=1)
+    cdf[:, -1] = 1.0
+    # Offsetting each row by its index lets one searchsorted sample every distribution
+    flat_cdf = (cdf + np.arange(count)[:, None]).ravel()
+    flat_values = table.values.ravel()
+    mean, _ = draw_moments(table)
+
+    draws = np.zeros((count, trials), dtype=np.int64)
+    collected = np.zeros(count * trials, dtype=np.int64)
+    # Distributions that can never drop anything are abandoned immediately
+    hopeless = mean <= 0
+    draws[hopeless] = -1
+
+    # With a single possible quantity q at chance p, reaching the target takes
+    # k = ceil(target / q) successes, so the draw count is k plus a negative
+    # binomial number of failures and can be sampled exactly in one call
+    single = ~hopeless & ((table.probs[:, 1:] > 0).sum(axis=1) == 1)
+    if single.any():
+        column = table.probs[single, 1:].argmax(axis=1) + 1
+        quantity = table.values[single, column]
+        chance = table.probs[single, column]
+        successes = -(-target // quantity)
+        failures = rng.negative_binomial(successes[:, None], chance[:, None], size=(len(chance), trials))
+        draws[single] = np.where(successes[:, None] + failures > max_draws, -1, successes[:, None] + failures)
+
+    draws = draws.ravel()
+    active = np.flatnonzero(np.repeat(~hopeless & ~single, trials))
+
+    while len(active) > 0:
+        dist = active // trials
+        needed = target - collected[active]
+        chunk = np.minimum(np.ceil(needed / mean[dist] * 1.25).astype(np.int64) + 4, max_draws)
+        # Only the trials that fit in this iteration's batch are advanced
+        fits = np.searchsorted(np.cumsum(chunk), batch_size, side='right')
+        batch, rest = active[:max(fits, 1)], active[max(fits, 1):]
+        dist, needed, chunk = dist[:len(batch)], needed[:len(batch)], chunk[:len(batch)]
+
+        segment = np.repeat(np.arange(len(batch)), chunk)
+        starts = np.cumsum(chunk) - chunk
+        outcome = np.searchsorted(flat_cdf, rng.random(len(segment)) + dist[segment], side='right')
+        running = np.cumsum(flat_values[outcome])
+        running -= np.repeat(running[starts] - flat_values[outcome[starts]], chunk)
+
+        # First position per trial where the running total reaches what it needed
+        positions = np.where(running >= needed[segment], np.arange(len(segment)), len(segment))
+        first_hit = np.minimum.reduceat(positions, starts)
+        reached = first_hit < len(segment)
+        finished = batch[reached]
+        draws[finished] += first_hit[reached] - starts[reached] + 1
+        draws[finished[draws[finished] > max_draws]] = -1
+
+        unfinished = batch[~reached]
+        draws[unfinished] += chunk[~reached]
+        collected[unfinished] += running[starts[~reached] + chunk[~reached] - 1]
+
+        exhausted = draws[unfinished] >= max_draws
+        draws[unfinished[exhausted]] = -1
+        active = np.concatenate([unfinished[~exhausted], rest])
+
+    return draws.reshape(count, trials)
+
+def simulate_crafts_to_target(table, target, trials=1000, rng=None, **kwargs):
+    """
+    Monte Carlo number of crafts needed to collect `target` items, shape
+    (recipe groups, trials); index with table.recipe_group for per-recipe rows.
+    """
+    draws = simulate_draws_to_target(table, target, trials, rng=rng, **kwargs)[table.group_distribution]
+    per_craft = table.group_draws[:, None]
+    # Each craft yields whole batches of draws, and the running total only grows
+    return np.where(draws < 0, -1, -(-draws // per_craft))
+
+def summarize_crafts(crafts, percentiles=(50, 90, 99)):
+    """
+    Mean and percentiles of crafts needed per row over the trials that reached
+    the target, plus how many trials per row didn't (NaN if none did).
+    """
+    samples = np.where(crafts < 0, np.nan, crafts.astype(np.float64))
+    with warnings.catch_warnings():
+        # Rows where no trial reached the target are expected to be all-NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return {
+            'unreachable': (crafts < 0).sum(axis=1),
+            'mean': np.nanmean(samples, axis=1) if samples.size else np.zeros(0),
+            'percentiles': {p: np.nanpercentile(samples, p, axis=1) for p in percentiles} if samples.size else {}
+        }
+
+def check_known_distribution():
+    """
+    Compare the engine with distributions worked out by hand: a weighted list
+    (total weight 10.2) and a cargo drop with an absolute chance (total 0.3).
+    Returns True when everything matches.
+    """
+    from crafting_data import cargo_offset, get_list_possibilities
+
+    weighted_list = {'possibilities': [
+        [2.0, [[100, 1, [0, []], [0, 0]]]],
+        [3.0, [[100, 2, [0, []], [0, 0]], [200, 1, [0, []], [0, 0]]]],
+        [5.2, [[300, 1, [0, []], [0, 0]]]],
+    ]}
+    # Item type 1 is cargo, keyed past cargo_offset
+    absolute_list = {'possibilities': [[0.3, [[100, 1, [1, []], [0, 0]]]]]}
+
+    recipes = []
+    for item_list, target_id in [(weighted_list, 100), (absolute_list, cargo_offset + 100)]:
+        possibilities = get_list_possibilities(item_list, {100, 200, 300, cargo_offset + 100})
+        recipes.append((str(target_id), len(recipes), {'output_quantity': 1, 'possibilities': possibilities[target_id]}))
+    table = YieldTable(recipes)
+    mean, variance = expected_yields(table)
+
+    # 1 at 2/10.2 and 2 at 3/10.2: mean 8/10.2, E[X^2] 14/10.2
+    expected_mean = np.array([8 / 10.2, 0.3])
+    expected_variance = np.array([14 / 10.2 - (8 / 10.2) ** 2, 0.3 * 0.7])
+    exact = np.allclose(mean, expected_mean) and np.allclose(variance, expected_variance)
+
+    # A single draw of the absolute list needs on average 1 / 0.3 crafts
+    crafts = simulate_crafts_to_target(table, 1, 20000, rng=np.random.default_rng(0))
+    simulated = abs(crafts[table.recipe_group[1]].mean() - 1 / 0.3) < 0.1
+
+    print(f'Yield engine: exact moments {"match" if exact else "MISMATCH"}, '
+          f'simulation {"matches" if simulated else "MISMATCHES"} the hand-computed distribution')
+    return exact and simulated
+
+def main():
+    """Usage: yield_engine.py <item_id> [target_quantity] [trials] | --check"""
+    if len(sys.argv) < 2:
+        print(main.__doc__)
+        return 1
+    if sys.argv[1] == '--check':
+        return 0 if check_known_distribution() else 1
+    item_id = sys.argv[1]
+    target = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    trials = int(sys.argv[3]) if len(sys.argv) > 3 else 10000
+    if target < 1:
+        print('Target quantity must be at least 1')
+        return 1
+
+    with open('../BitPlanner/crafting_data.json', 'r') as f:
+        crafting_data = json.load(f)
+
+    table = YieldTable(collect_loot_recipes(crafting_data))
+    start = time.perf_counter()
+    mean, variance = expected_yields(table)
+    crafts = simulate_crafts_to_target(table, target, trials)
+    summary = summarize_crafts(crafts)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f'Simulated {len(table)} loot recipes x {trials} trials in {elapsed:.1f} ms')
+
+    for index, (recipe_item, recipe_idx) in enumerate(table.recipes):
+        if recipe_item != item_id:
+            continue
+        group = table.recipe_group[index]
+        print(f"{crafting_data[item_id]['name']} recipe {recipe_idx}:")
+        print(f'  expected yield {mean[index]:.4f} per craft (variance {variance[index]:.4f})')
+        percentiles = ', '.join(f'p{p} {values[group]:.0f}' for p, values in summary['percentiles'].items())
+        print(f"  crafts for {target}: mean {summary['mean'][group]:.1f}, {percentiles}")
+        if summary['unreachable'][group]:
+            print(f"  {summary['unreachable'][group]} of {trials} trials didn't reach {target} within the draw limit")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,66 @@
 import React, { useEffect } from 'react';
 import { useItemsStore } from './state/useItemsStore';
-import { ItemsData } from './types/Item';
+import { DataManifest, ItemsData } from './types/Item';
 import BitCalculatorPage from './components/BitCalculatorPage';
 import './App.css';
 
 function App() {
   const { 
     setItems, 
+    mergeItems,
     setIsLoading, 
-    isLoading
+    setRecipesLoading,
+    setRecipesError,
+    isLoading,
+    recipesLoading,
+    recipesError
   } = useItemsStore();
 
   useEffect(() => {
     async function loadItems() {
       try {
         setIsLoading(true);
-        const response = await fetch('/data/recipes.json');
-        const data: ItemsData = await response.json();
-        setItems(data);
+        // The manifest is enough to render the item list; recipes arrive per shard
+        const response = await fetch('/data/manifest.json', { cache: 'no-cache' });
+        if (!response.ok) {
+          throw new Error(`manifest.json: HTTP ${response.status}`);
+        }
+        const manifest: DataManifest = await response.json();
+
+        const placeholders: ItemsData = {};
+        Object.entries(manifest.items).forEach(([id, [name, tier, rarity, icon, extraction_skill]]) => {
+          placeholders[id] = { name, tier, rarity, icon, extraction_skill, recipes: [], pending: true };
+        });
+        setItems(placeholders);
+        setRecipesLoading(true);
+        setIsLoading(false);
+
+        // Shard names are content-hashed, so an unchanged shard keeps its URL across data updates
+        const results = await Promise.allSettled(manifest.shards.map(async shard => {
+          const shardResponse = await fetch(`/data/${shard.file}`);
+          if (!shardResponse.ok) {
+            throw new Error(`${shard.file}: HTTP ${shardResponse.status}`);
+          }
+          const data: ItemsData = await shardResponse.json();
+          mergeItems(data);
+        }));
+
+        const failed = results.filter(result => result.status === 'rejected');
+        if (failed.length > 0) {
+          failed.forEach(result => console.error('Failed to load recipes:', (result as PromiseRejectedResult).reason));
+          setRecipesError(`Failed to load ${failed.length} of ${manifest.shards.length} recipe files. Reload the page to try again.`);
+        }
+        setRecipesLoading(false);
       } catch (error) {
         console.error('Failed to load items:', error);
-      } finally {
+        setRecipesError('Failed to load BitCraft items. Reload the page to try again.');
+        setRecipesLoading(false);
         setIsLoading(false);
       }
     }
 
     loadItems();
-  }, [setItems, setIsLoading]);
+  }, [setItems, mergeItems, setIsLoading, setRecipesLoading, setRecipesError]);
 
   if (isLoading) {
     return (
@@ -42,6 +76,16 @@ function App() {
         <h1 className="text-5xl font-bold text-center mb-8 text-blue-600">
           BitCraft Calculator
         </h1>
+
+        {recipesError ? (
+          <div className="mb-4 text-center text-sm text-red-700 bg-red-50 border border-red-200 rounded-lg p-2">
+            {recipesError}
+          </div>
+        ) : recipesLoading && (
+          <div className="mb-4 text-center text-sm text-slate-600">
+            Loading recipes...
+          </div>
+        )}
         
         {/* Main Application - Bit Calculator */}
         <div className="h-[calc(100vh-200px)]">
@@ -8,7 +8,7 @@ import BuildSteps from './BuildSteps';
 
 const BitCalculatorPage: React.FC = () => {
   const [activeView, setActiveView] = useState<'steps' | 'materials' | 'inventory'>('steps');
-  const { buildList } = useItemsStore();
+  const { buildList, recipesLoading, recipesError } = useItemsStore();
 
   return (
     <div className="h-full flex flex-col">
@@ -92,9 +92,22 @@ const BitCalculatorPage: React.FC = () => {
 
             {/* Content */}
             <div className="flex-1 min-h-0">
-              {activeView === 'steps' && <BuildSteps />}
-              {activeView === 'materials' && <MaterialSummary />}
-              {activeView === 'inventory' && <InventoryInput />}
+              {/* Calculations would treat ingredients without loaded recipes as base items */}
+              {recipesError ? (
+                <div className="text-sm text-red-700 bg-red-50 border border-red-200 rounded-lg p-3">
+                  {recipesError}
+                </div>
+              ) : recipesLoading ? (
+                <div className="text-sm text-slate-600 bg-slate-100 rounded-lg p-3">
+                  Loading recipes...
+                </div>
+              ) : (
+                <>
+                  {activeView === 'steps' && <BuildSteps />}
+                  {activeView === 'materials' && <MaterialSummary />}
+                  {activeView === 'inventory' && <InventoryInput />}
+                </>
+              )}
             </div>
           </div>
         </div>
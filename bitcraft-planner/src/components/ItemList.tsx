@@ -189,6 +189,7 @@ const ItemList: React.FC<ItemListProps> = ({ showAddToBuilds = false }) => {
           {displayedItems.length > 0 ? (
             displayedItems.map(([id, item]) => {
               const canCraft = item.recipes && item.recipes.length > 0;
+              const isBase = !canCraft && !item.pending;
               const quantity = addQuantities[id] || 1;
               
               return (
@@ -207,7 +208,7 @@ const ItemList: React.FC<ItemListProps> = ({ showAddToBuilds = false }) => {
                           <span className={`text-xs font-medium px-1.5 py-0.5 rounded ${RARITY_COLORS[item.rarity as keyof typeof RARITY_COLORS] || 'text-gray-400'} bg-slate-200`}>
                             {(RARITY_NAMES[item.rarity as keyof typeof RARITY_NAMES] || 'Unknown').charAt(0)}
                           </span>
-                          {!canCraft && (
+                          {isBase && (
                             <span className="text-xs font-medium text-orange-600 bg-orange-100 px-1.5 py-0.5 rounded">
                               Base
                             </span>
@@ -241,13 +242,13 @@ const ItemList: React.FC<ItemListProps> = ({ showAddToBuilds = false }) => {
                           )}
                           {!canCraft && (
                             <div className="text-xs font-medium text-slate-500 bg-slate-200 px-2 py-0.5 rounded">
-                              N/A
+                              {item.pending ? '…' : 'N/A'}
                             </div>
                           )}
                         </div>
                       ) : (
                         <div className="text-xs font-medium text-slate-600 bg-slate-200 px-2 py-0.5 rounded">
-                          {item.recipes.length > 0 ? `${item.recipes.length}R` : 'Base'}
+                          {item.pending ? '…' : item.recipes.length > 0 ? `${item.recipes.length}R` : 'Base'}
                         </div>
                       )}
                     </div>
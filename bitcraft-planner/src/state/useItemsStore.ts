@@ -33,17 +33,22 @@ interface ItemsStore {
   recipeTypeFilter: 'all' | 'craftable' | 'base' | null;
   professionFilter: string | null;
   isLoading: boolean;
+  recipesLoading: boolean;
+  recipesError: string | null;
   inventory: Inventory;
   showInventoryManager: boolean;
   buildList: BuildListItem[];
   
   setItems: (items: ItemsData) => void;
+  mergeItems: (items: ItemsData) => void;
   setSearchTerm: (term: string) => void;
   setTierFilter: (tier: number | null) => void;
   setRarityFilter: (rarity: number | null) => void;
   setRecipeTypeFilter: (type: 'all' | 'craftable' | 'base' | null) => void;
   setProfessionFilter: (profession: string | null) => void;
   setIsLoading: (loading: boolean) => void;
+  setRecipesLoading: (loading: boolean) => void;
+  setRecipesError: (error: string | null) => void;
   setInventoryItem: (itemId: string, quantity: number) => void;
   removeInventoryItem: (itemId: string) => void;
   clearInventory: () => void;
@@ -70,17 +75,22 @@ export const useItemsStore = create<ItemsStore>((set, get) => ({
   recipeTypeFilter: 'craftable',
   professionFilter: null,
   isLoading: true,
+  recipesLoading: false,
+  recipesError: null,
   inventory: {},
   showInventoryManager: false,
   buildList: [],
   
   setItems: (items) => set({ items }),
+  mergeItems: (items) => set((state) => ({ items: { ...state.items, ...items } })),
   setSearchTerm: (term) => set({ searchTerm: term }),
   setTierFilter: (tier) => set({ tierFilter: tier }),
   setRarityFilter: (rarity) => set({ rarityFilter: rarity }),
   setRecipeTypeFilter: (type) => set({ recipeTypeFilter: type }),
   setProfessionFilter: (profession) => set({ professionFilter: profession }),
   setIsLoading: (loading) => set({ isLoading: loading }),
+  setRecipesLoading: (loading) => set({ recipesLoading: loading }),
+  setRecipesError: (error) => set({ recipesError: error }),
   setInventoryItem: (itemId, quantity) => set((state) => ({
     inventory: quantity > 0 
       ? { ...state.inventory, [itemId]: quantity }
@@ -157,7 +167,8 @@ export const useItemsStore = create<ItemsStore>((set, get) => ({
     if (recipeTypeFilter === 'craftable') {
       filtered = filtered.filter(([_, item]) => item.recipes && item.recipes.length > 0);
     } else if (recipeTypeFilter === 'base') {
-      filtered = filtered.filter(([_, item]) => !item.recipes || item.recipes.length === 0);
+      // Items whose recipes haven't loaded yet are not known to be base items
+      filtered = filtered.filter(([_, item]) => !item.pending && (!item.recipes || item.recipes.length === 0));
     }
     
     // Sort by tier first, then by name for better organization
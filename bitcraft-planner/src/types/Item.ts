@@ -25,8 +25,28 @@ export interface Item {
   icon: string;
   recipes: Recipe[];
   extraction_skill: number;
+  // Set on items known only from the manifest until their recipe shard has loaded
+  pending?: boolean;
 }
 
 export interface ItemsData {
   [id: string]: Item;
-} 
\ No newline at end of file
+} 
+export interface DataShard {
+  file: string;
+  // Tier band: tiers below 0 are grouped under 0 and tiers above 10 under 10
+  tier: number;
+  // Fixed [low, high) id range; high is null for the last range
+  ids: [number, number | null];
+  count: number;
+  bytes: number;
+}
+
+// Item list entries are arrays ordered by `fields`; the last field is the shard index
+export interface DataManifest {
+  fields: string[];
+  shards: DataShard[];
+  items: {
+    [id: string]: [string, number, number, string, number, number];
+  };
+}